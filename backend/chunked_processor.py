@@ -0,0 +1,222 @@
+import os
+import json
+import hashlib
+import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import cv2
+from backend.video_processor import VideoProcessor
+from backend.results_handler import ResultsHandler
+
+
+def _seek(cap, frame_index):
+    """
+    Posiciona el video para que el próximo `grab` lea `frame_index`.
+    El contador de OpenCV tras `set` sale de la misma estimación que el salto,
+    así que se compara el tiempo del primer fotograma decodificado con el
+    esperado. Si no coincide (salto a un keyframe o frame rate variable) se
+    avanza desde el inicio. Es una verificación de mejor esfuerzo: supone que
+    los tiempos del contenedor empiezan en cero.
+    """
+    if frame_index == 0:
+        return cap.grab()
+
+    cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+    ok = cap.grab()
+    fps = cap.get(cv2.CAP_PROP_FPS)
+    if ok and fps > 0:
+        expected_ms = frame_index * 1000.0 / fps
+        if abs(cap.get(cv2.CAP_PROP_POS_MSEC) - expected_ms) <= 500.0 / fps:
+            return True
+
+    cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
+    for _ in range(frame_index + 1):
+        ok = cap.grab()
+        if not ok:
+            break
+    return ok
+
+
+def _process_chunk(video_path, start, end, warmup, mode, plane):
+    """
+    Procesa el rango de fotogramas [start, end) de un video en un proceso aparte.
+    Empieza `warmup` fotogramas antes para que el seguimiento de MediaPipe se
+    estabilice; esos fotogramas se procesan pero no se guardan.
+    Si `end` es None (último fragmento) se lee hasta el final del archivo, ya
+    que la cantidad de fotogramas del encabezado puede ser una estimación.
+    Lanza IOError si un fragmento intermedio no se lee completo, para que no
+    se guarde como terminado.
+    """
+    processor = VideoProcessor()  # MediaPipe no se puede compartir entre procesos
+    cap = cv2.VideoCapture(video_path)
+    seek_to = max(0, start - warmup)
+    ok = _seek(cap, seek_to)
+
+    rows = []
+    frame_index = seek_to
+    while ok and (end is None or frame_index < end):
+        ret, frame = cap.retrieve()
+        if not ret:
+            break
+
+        results = processor.process_frame(frame)
+        if frame_index >= start:  # Los anteriores son de calentamiento
+            row = {"frame": frame_index}
+            if results.pose_landmarks:
+                metrics = processor.calculate_metrics(
+                    results.pose_landmarks.landmark, mode=mode, plane=plane
+                )
+                row.update({key: float(value) for key, value in metrics.items()})
+            rows.append(row)
+
+        frame_index += 1
+        ok = cap.grab()
+
+    cap.release()
+    if end is not None and len(rows) != end - start:
+        raise IOError(f"Chunk {start}-{end} incomplete: read {len(rows)} of {end - start} frames")
+    return rows
+
+
+class ChunkedVideoProcessor:
+    def __init__(self, chunk_size=1800, warmup=30, workers=None, checkpoint_dir="results/checkpoints"):
+        """
+        :param chunk_size: Cantidad de fotogramas por fragmento.
+        :param warmup: Fotogramas previos procesados para estabilizar el seguimiento.
+        :param workers: Cantidad de procesos (por defecto, uno por núcleo).
+        :param checkpoint_dir: Carpeta donde se guarda el progreso de cada fragmento.
+        """
+        self.chunk_size = chunk_size
+        self.warmup = warmup
+        self.workers = workers or os.cpu_count()
+        self.checkpoint_dir = checkpoint_dir
+
+    def split_ranges(self, total_frames):
+        """
+        Divide el video en rangos de fotogramas [start, end). El último rango
+        queda abierto (end=None) y se lee hasta el final del archivo.
+        """
+        starts = list(range(0, total_frames, self.chunk_size))
+        return [
+            (start, starts[i + 1] if i + 1 < len(starts) else None)
+            for i, start in enumerate(starts)
+        ]
+
+    def get_checkpoint_path(self, video_path, mode, plane, start, end):
+        """
+        Retorna la ruta del checkpoint de un fragmento. El nombre incluye una
+        huella del archivo (ruta, tamaño y fecha de modificación) y los parámetros
+        de cálculo para no reutilizar resultados de otro video o incompatibles.
+        """
+        video_name = os.path.splitext(os.path.basename(video_path))[0]
+        stat = os.stat(video_path)
+        identity = f"{os.path.abspath(video_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+        video_hash = hashlib.sha1(identity.encode()).hexdigest()[:10]
+        folder = os.path.join(self.checkpoint_dir, f"{video_name}_{video_hash}_{mode}_{plane}_w{self.warmup}")
+        os.makedirs(folder, exist_ok=True)
+        end_label = "eof" if end is None else f"{end:08d}"
+        return os.path.join(folder, f"chunk_{start:08d}_{end_label}.json")
+
+    def load_checkpoint(self, path):
+        """
+        Carga un fragmento ya procesado, o None si no existe o está incompleto.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_checkpoint(self, path, rows):
+        """
+        Guarda un fragmento de forma atómica para que un proceso interrumpido
+        no deje un checkpoint a medio escribir.
+        """
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(rows, f)
+        os.replace(tmp_path, path)
+
+    def process_video(self, video_path, mode="relative", plane="horizontal"):
+        """
+        Procesa un video completo en paralelo por fragmentos y retorna las
+        métricas de cada fotograma en orden.
+        :param video_path: Ruta del video.
+        :param mode: Modo de cálculo de ángulos ("relative" o "fixed").
+        :param plane: "horizontal" o "vertical".
+        :return: Lista de diccionarios, uno por fotograma.
+        """
+        cap = cv2.VideoCapture(video_path)
+        if not cap.isOpened():
+            raise IOError(f"Unable to open the video file: {video_path}")
+        total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
+        cap.release()
+        if total_frames <= 0:
+            raise IOError(f"Unable to determine the frame count of: {video_path}")
+
+        chunks = {}
+        pending = []
+        for start, end in self.split_ranges(total_frames):
+            path = self.get_checkpoint_path(video_path, mode, plane, start, end)
+            rows = self.load_checkpoint(path)
+            if rows is None:
+                pending.append((start, end, path))
+            else:
+                chunks[start] = rows
+
+        total_chunks = len(chunks) + len(pending)
+        print(f"Chunks: {len(chunks)} restored, {len(pending)} pending")
+
+        if pending:
+            failures = []
+            executor = ProcessPoolExecutor(max_workers=self.workers)
+            try:
+                futures = {
+                    executor.submit(_process_chunk, video_path, start, end, self.warmup, mode, plane): (start, end, path)
+                    for start, end, path in pending
+                }
+                for future in as_completed(futures):
+                    start, end, path = futures[future]
+                    if future.cancelled():
+                        continue
+                    try:
+                        rows = future.result()
+                    except Exception as e:
+                        # Los fragmentos son independientes: se sigue con el resto
+                        print(f"Chunk {start}-{end} failed: {e}")
+                        failures.append((start, end, e))
+                        continue
+                    self.save_checkpoint(path, rows)
+                    chunks[start] = rows
+                    print(f"Chunk {start}-{end} done ({len(chunks)}/{total_chunks})")
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+            if failures:
+                start, end, error = failures[0]
+                raise RuntimeError(
+                    f"{len(failures)} chunk(s) failed (first: {start}-{end}: {error}); "
+                    f"{len(chunks)}/{total_chunks} chunks checkpointed, run again to resume"
+                ) from error
+
+        # Unir los fragmentos en orden
+        return [row for start in sorted(chunks) for row in chunks[start]]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Procesa un video largo en paralelo por fragmentos.")
+    parser.add_argument("video_path")
+    parser.add_argument("--mode", default="relative", choices=["relative", "fixed"])
+    parser.add_argument("--plane", default="horizontal", choices=["horizontal", "vertical"])
+    parser.add_argument("--chunk-size", type=int, default=1800)
+    parser.add_argument("--warmup", type=int, default=30)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    chunked = ChunkedVideoProcessor(chunk_size=args.chunk_size, warmup=args.warmup, workers=args.workers)
+    data = chunked.process_video(args.video_path, mode=args.mode, plane=args.plane)
+
+    handler = ResultsHandler()
+    video_name = os.path.splitext(os.path.basename(args.video_path))[0]
+    handler.save_to_json(data, filename=f"{video_name}_metrics.json")
@@ -2,6 +2,8 @@ import cv2
 import mediapipe as mp
 import numpy as np
 import math
+from types import SimpleNamespace
+from mediapipe.framework.formats import landmark_pb2
 
 class VideoProcessor:
     def __init__(self):
@@ -42,6 +44,30 @@ class VideoProcessor:
                         metrics[metric]
                     )
 
+    def landmarks_to_roi(self, results, roi_x, roi_y, roi_width, roi_height, frame_width, frame_height):
+        """
+        Convierte los landmarks (normalizados al fotograma completo) a coordenadas
+        normalizadas de una región recortada, para dibujarlos sobre el recorte sin
+        volver a procesar el fotograma.
+        :param results: Resultados de MediaPipe sobre el fotograma completo.
+        :param roi_x: Esquina izquierda de la región, en píxeles del fotograma.
+        :param roi_y: Esquina superior de la región, en píxeles del fotograma.
+        :param roi_width: Ancho de la región en píxeles.
+        :param roi_height: Alto de la región en píxeles.
+        :param frame_width: Ancho del fotograma completo en píxeles.
+        :param frame_height: Alto del fotograma completo en píxeles.
+        :return: Objeto con `pose_landmarks` en coordenadas de la región.
+        """
+        if not results.pose_landmarks:
+            return results
+
+        roi_landmarks = landmark_pb2.NormalizedLandmarkList()
+        roi_landmarks.CopyFrom(results.pose_landmarks)
+        for landmark in roi_landmarks.landmark:
+            landmark.x = (landmark.x * frame_width - roi_x) / roi_width
+            landmark.y = (landmark.y * frame_height - roi_y) / roi_height
+        return SimpleNamespace(pose_landmarks=roi_landmarks)
+
     def get_landmark_for_metric(self, metric):
         """
         Retorna el landmark relevante para mostrar el ángulo calculado.
@@ -32,6 +32,23 @@ class PoseApp:
         self.mode = tk.StringVar(value="relative")  # "relative" o "fixed"
         self.plane = tk.StringVar(value="horizontal")  # "horizontal" o "vertical"
 
+        # Último fotograma procesado (resolución completa) para redibujar con zoom
+        self.current_frame = None
+        self.current_results = None
+        self.current_metrics = {}
+        self.current_mode = "relative"
+        self.current_plane = "horizontal"
+
+        # Zoom y desplazamiento (esquina superior izquierda visible, en píxeles del video)
+        self.zoom_level = 1.0
+        self.max_zoom = 8.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.drag_x = 0
+        self.drag_y = 0
+        self.redraw_pending = False
+        self.canvas_image_id = None
+
         # Velocidad de reproducción
         self.play_speed = tk.DoubleVar(value=1.0)
 
@@ -89,6 +106,9 @@ class PoseApp:
         self.canvas.bind("<Button-1>", self.canvas_click)
         self.canvas.bind("<B1-Motion>", self.canvas_drag)
         self.canvas.bind("<MouseWheel>", self.canvas_zoom)
+        self.canvas.bind("<Button-4>", self.canvas_zoom)  # Rueda en Linux
+        self.canvas.bind("<Button-5>", self.canvas_zoom)
+        self.canvas.bind("<Double-Button-1>", self.reset_view)
 
         # Panel de métricas
         self.metrics_frame = ttk.Frame(self.root, padding=10)
@@ -183,44 +203,161 @@ class PoseApp:
         Maneja el clic del ratón sobre el canvas.
         """
         x, y = event.x, event.y
+        self.drag_x, self.drag_y = x, y  # Punto de partida para el arrastre
         canvas_coords = self.canvas_coords_to_video_coords(x, y)
         print(f"Canvas clicked at ({x}, {y}), Video coords: {canvas_coords}")
 
     def canvas_drag(self, event):
         """
-        Maneja el arrastre del ratón sobre el canvas.
+        Maneja el arrastre del ratón sobre el canvas (desplaza la vista con zoom).
         """
-        self.offset_x += event.x - self.canvas_width // 2
-        self.offset_y += event.y - self.canvas_height // 2
-        print(f"Dragging offset: ({self.offset_x}, {self.offset_y})")
-        self.redraw_canvas()
+        dx = event.x - self.drag_x
+        dy = event.y - self.drag_y
+        self.drag_x, self.drag_y = event.x, event.y
+        if self.current_frame is None:
+            return
+        scale, _, _ = self.view_geometry()
+        self.offset_x -= dx / scale
+        self.offset_y -= dy / scale
+        self.clamp_offsets()
+        self.schedule_redraw()
 
     def canvas_zoom(self, event):
         """
-        Maneja el zoom en el canvas con la rueda del ratón.
+        Maneja el zoom en el canvas con la rueda del ratón, manteniendo fijo
+        el punto del video bajo el cursor.
         """
-        zoom_factor = 0.1
-        if event.delta > 0:
-            self.zoom_level += zoom_factor
-        elif event.delta < 0 and self.zoom_level > zoom_factor:
-            self.zoom_level -= zoom_factor
-        print(f"Zoom level: {self.zoom_level}")
-        self.redraw_canvas()
+        zoom_factor = 1.25
+        if event.num == 4 or event.delta > 0:
+            new_zoom = min(self.zoom_level * zoom_factor, self.max_zoom)
+        elif event.num == 5 or event.delta < 0:
+            new_zoom = max(self.zoom_level / zoom_factor, 1.0)
+        else:
+            return
+
+        if self.current_frame is None:
+            self.zoom_level = new_zoom
+            return
+
+        # Se usa el estado de la vista (no la última imagen dibujada) porque
+        # varios eventos pueden llegar antes del redibujado
+        video_x, video_y = self.canvas_coords_to_video_coords(event.x, event.y, as_int=False)
+        self.zoom_level = new_zoom
+        scale, pad_x, pad_y = self.view_geometry()
+        self.offset_x = video_x - (event.x - pad_x) / scale
+        self.offset_y = video_y - (event.y - pad_y) / scale
+        self.clamp_offsets()
+        print(f"Zoom level: {self.zoom_level:.2f}")
+        self.schedule_redraw()
+
+    def reset_view(self, event=None):
+        """
+        Restablece el zoom y el desplazamiento.
+        """
+        self.zoom_level = 1.0
+        self.offset_x = 0.0
+        self.offset_y = 0.0
+        self.schedule_redraw()
+
+    def view_geometry(self):
+        """
+        Calcula, a partir del zoom actual, la escala de video a canvas y el
+        margen negro a cada lado de la imagen.
+        :return: (escala, margen_x, margen_y).
+        """
+        video_height, video_width, _ = self.current_frame.shape
+        fit_scale = min(self.canvas_width / video_width, self.canvas_height / video_height)
+        pad_x = (self.canvas_width - video_width * fit_scale) / 2
+        pad_y = (self.canvas_height - video_height * fit_scale) / 2
+        return fit_scale * self.zoom_level, pad_x, pad_y
+
+    def clamp_offsets(self):
+        """
+        Limita el desplazamiento para que la región visible no salga del video.
+        """
+        video_height, video_width, _ = self.current_frame.shape
+        max_x = video_width - video_width / self.zoom_level
+        max_y = video_height - video_height / self.zoom_level
+        self.offset_x = min(max(self.offset_x, 0.0), max_x)
+        self.offset_y = min(max(self.offset_y, 0.0), max_y)
+
+    def schedule_redraw(self):
+        """
+        Agrupa varios eventos de ratón en un solo redibujado.
+        """
+        if not self.redraw_pending:
+            self.redraw_pending = True
+            self.root.after_idle(self.redraw_canvas)
 
     def redraw_canvas(self):
         """
         Redibuja el contenido del canvas ajustado al zoom y desplazamiento.
+        Recorta la región visible del último fotograma en caché y redibuja los
+        landmarks sobre ella, sin decodificar ni procesar de nuevo.
         """
-        # Aquí se debería ajustar la imagen en el canvas basado en zoom y desplazamiento
-        pass
+        self.redraw_pending = False
+        if self.current_frame is None:
+            return
 
-    def canvas_coords_to_video_coords(self, x, y):
+        video_height, video_width, _ = self.current_frame.shape
+
+        # Región visible del fotograma, limitada a los bordes del video
+        roi_width = video_width / self.zoom_level
+        roi_height = video_height / self.zoom_level
+        self.clamp_offsets()
+        x0, y0 = int(self.offset_x), int(self.offset_y)
+        x1 = min(int(round(self.offset_x + roi_width)), video_width)
+        y1 = min(int(round(self.offset_y + roi_height)), video_height)
+        roi = self.current_frame[y0:y1, x0:x1]
+
+        # Escalar la región mientras se mantiene la proporción
+        scale = min(self.canvas_width / roi.shape[1], self.canvas_height / roi.shape[0])
+        new_width = int(roi.shape[1] * scale)
+        new_height = int(roi.shape[0] * scale)
+        interpolation = cv2.INTER_LINEAR if scale > 1 else cv2.INTER_AREA
+        roi = cv2.resize(roi, (new_width, new_height), interpolation=interpolation)
+
+        # Dibujar los landmarks en coordenadas de la región
+        if self.current_results is not None:
+            roi_results = self.processor.landmarks_to_roi(
+                self.current_results, x0, y0, x1 - x0, y1 - y0, video_width, video_height
+            )
+            self.processor.draw_landmarks(
+                roi, roi_results,
+                selected_metrics={key: var.get() for key, var in self.selected_metrics.items()},
+                mode=self.current_mode,
+                plane=self.current_plane,
+                metrics=self.current_metrics
+            )
+
+        # Crear un fondo negro si la imagen no llena todo el canvas
+        padded_frame = np.zeros((self.canvas_height, self.canvas_width, 3), dtype=np.uint8)
+        y_offset = (self.canvas_height - new_height) // 2
+        x_offset = (self.canvas_width - new_width) // 2
+        padded_frame[y_offset:y_offset + new_height, x_offset:x_offset + new_width] = roi
+
+        # Mostrar el frame, reutilizando el mismo elemento del canvas
+        padded_frame = cv2.cvtColor(padded_frame, cv2.COLOR_BGR2RGB)
+        img = ImageTk.PhotoImage(Image.fromarray(padded_frame))
+        if self.canvas_image_id is None:
+            self.canvas_image_id = self.canvas.create_image(0, 0, anchor=tk.NW, image=img)
+        else:
+            self.canvas.itemconfig(self.canvas_image_id, image=img)
+        self.canvas.image = img
+
+    def canvas_coords_to_video_coords(self, x, y, as_int=True):
         """
         Convierte coordenadas del canvas a las coordenadas del video considerando zoom y desplazamiento.
         """
-        video_x = (x - self.offset_x) / self.zoom_level
-        video_y = (y - self.offset_y) / self.zoom_level
-        return int(video_x), int(video_y)
+        if self.current_frame is None:
+            return (int(x), int(y)) if as_int else (x, y)
+        self.clamp_offsets()
+        scale, pad_x, pad_y = self.view_geometry()
+        video_x = self.offset_x + (x - pad_x) / scale
+        video_y = self.offset_y + (y - pad_y) / scale
+        if as_int:
+            return int(video_x), int(video_y)
+        return video_x, video_y
 
     def update_dashboard(self, metrics):
         """
@@ -248,6 +385,8 @@ class PoseApp:
             return
 
         self.processed_frames = []  # Reiniciar los resultados procesados
+        self.current_frame = None
+        self.reset_view()
         self.reset_graph_data()
         self.play_video()
 
@@ -275,45 +414,29 @@ class PoseApp:
             self.cap.release()
             return
 
-        # Escalar el video mientras se mantiene la proporción
-        video_height, video_width, _ = frame.shape
-        scale = min(self.canvas_width / video_width, self.canvas_height / video_height)
-        new_width = int(video_width * scale)
-        new_height = int(video_height * scale)
-        frame = cv2.resize(frame, (new_width, new_height))
-
-        # Crear un fondo negro si el video no llena todo el canvas
-        padded_frame = np.zeros((self.canvas_height, self.canvas_width, 3), dtype=np.uint8)
-        y_offset = (self.canvas_height - new_height) // 2
-        x_offset = (self.canvas_width - new_width) // 2
-        padded_frame[y_offset:y_offset + new_height, x_offset:x_offset + new_width] = frame
-
-        # Procesar el fotograma
-        results = self.processor.process_frame(padded_frame)
+        # Procesar el fotograma a resolución completa
+        results = self.processor.process_frame(frame)
 
+        mode = self.mode.get()
+        plane = self.plane.get()
+        metrics = {}
         if results.pose_landmarks:
             metrics = self.processor.calculate_metrics(
-            results.pose_landmarks.landmark,
-            mode=self.mode.get(),
-            plane=self.plane.get()
-        )
-        self.processor.draw_landmarks(
-            padded_frame, results,
-            selected_metrics={key: var.get() for key, var in self.selected_metrics.items()},
-            mode=self.mode.get(),
-            plane=self.plane.get(),
-            metrics=metrics
-        )
-
+                results.pose_landmarks.landmark,
+                mode=mode,
+                plane=plane
+            )
+
+        # Guardar el fotograma para poder redibujar con zoom sin volver a procesar
+        self.current_frame = frame
+        self.current_results = results
+        self.current_metrics = metrics
+        self.current_mode = mode  # Los arcos se dibujan con el modo usado para las métricas
+        self.current_plane = plane
 
+        self.redraw_canvas()
         self.update_dashboard(metrics)
 
-        # Mostrar el frame procesado
-        padded_frame = cv2.cvtColor(padded_frame, cv2.COLOR_BGR2RGB)
-        img = ImageTk.PhotoImage(Image.fromarray(padded_frame))
-        self.canvas.create_image(0, 0, anchor=tk.NW, image=img)
-        self.canvas.image = img
-
         if not self.is_paused:
             self.root.after(int(1000 / (30 * self.play_speed.get())), self.play_video)
 
@@ -338,5 +461,6 @@ class PoseApp:
         if self.cap:
             self.cap.set(cv2.CAP_PROP_POS_FRAMES, 0)
             self.is_paused = False
+            self.reset_view()
             self.reset_graph_data()
             self.play_video()